@@ -1,17 +1,18 @@
 #!/usr/bin/env python
 import argparse
+import functools
 import logging
 import math
 import os
 import sys
-from subprocess import DEVNULL, run
 
 import matplotlib
+
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-from matplotlib.backends.backend_pdf import PdfPages
 
 sns.set(style="whitegrid")
 sns.set_context("paper", font_scale=1.5)
@@ -24,12 +25,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _read_csv(path):
+    """Parse a CSV once per session."""
+    return pd.read_csv(path, skipinitialspace=True, thousands=",")
+
+
+def _load(path):
+    """Load a CSV, returning a private copy of the cached parse."""
+    return _read_csv(path).copy()
+
+
 def _plot(datafile, outfile):
     """Plotting logic."""
     # Mfr PartNumber,GBWP (kHz),Supply Current (uA),GBWP/uA,min_voltage,max_voltage
     logger.info("Plotting from {}...".format(datafile))
 
-    data = pd.read_csv(datafile, skipinitialspace=True, thousands=",")
+    data = _load(datafile)
 
     fig, ax = plt.subplots(figsize=(7, 5))
     plot = sns.catplot(
@@ -46,10 +58,7 @@ def _plot(datafile, outfile):
     plot._legend.set_title("technique")
     #  plot.set(xlim=(0, 100))
     plot.set(ylim=(0, 100))
-    pp = PdfPages(outfile)
-    pp.savefig(plot.fig.tight_layout())
-    pp.close()
-    run(["pdfcrop", outfile, outfile], stdout=DEVNULL, check=True)
+    plot.fig.savefig(outfile, bbox_inches="tight", pad_inches=0.02)
     logger.info(f"Plot saved to {outfile}")
 
 
@@ -0,0 +1,41 @@
+"""Helpers shared by the plotting scripts in this directory."""
+import csv
+import functools
+
+import pandas as pd
+
+
+def _raw_names(path):
+    """Map each stripped header name in a CSV to its name as written."""
+    with open(path, newline="") as f:
+        header = next(csv.reader(f))
+    return {name.strip(): name for name in header}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv(path, usecols=None, dtype=None):
+    """Parse a CSV once per session."""
+    # The pyarrow engine has no skipinitialspace, so translate stripped column
+    # names back to the padded ones in the file before matching them
+    raw = _raw_names(path)
+    if usecols is not None:
+        usecols = [raw.get(name, name) for name in usecols]
+    if isinstance(dtype, tuple):
+        dtype = {raw.get(name, name): kind for name, kind in dtype}
+    data = pd.read_csv(path, engine="pyarrow", usecols=usecols, dtype=dtype)
+    data.columns = data.columns.str.strip()
+    return data
+
+
+def load(path, usecols=None, dtype=None):
+    """Load a CSV, returning a private copy of the cached parse.
+
+    Column names are stripped of surrounding whitespace, and ``usecols`` and
+    ``dtype`` keys refer to the stripped names. Both are converted to tuples
+    so they can be part of the cache key.
+    """
+    if usecols is not None:
+        usecols = tuple(usecols)
+    if isinstance(dtype, dict):
+        dtype = tuple(dtype.items())
+    return _read_csv(path, usecols, dtype).copy()
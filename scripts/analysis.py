@@ -2,14 +2,16 @@
 import argparse
 import logging
 import sys
-from subprocess import DEVNULL, run
 
 import matplotlib
+
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 import numpy as np
-from matplotlib.backends.backend_pdf import PdfPages
+
+from _common import load
 
 sns.set(style="whitegrid")
 sns.set_context("paper", font_scale=1.5, rc={"lines.linewidth": 1.50})
@@ -24,53 +26,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 FIGSIZE = (7, 3)
+KINDS = ["fvideo", "lower-bound"]
 
 
-def _plot(infile):
-    """Plotting logic."""
-    fig, ax = plt.subplots(figsize=FIGSIZE)
-
-    # type,b,f1,precision,recall
-    data = pd.read_csv(infile, skipinitialspace=True)
+def _fig_hist(e2e_ms):
+    """Plot a histogram of end-to-end latency."""
+    fig, ax = plt.subplots(figsize=FIGSIZE, constrained_layout=True)
 
-    # Plot PDF
-    plot = sns.distplot(data["e2e_us"] / 1000.0, kde=False, bins=25, ax=ax)
+    counts, edges = np.histogram(e2e_ms, bins=25)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", alpha=0.4)
 
     sns.despine(bottom=True, left=True)
-    plot.set(xlabel="End-to-end Latency (ms)")
-    plot.set(ylabel="Histogram")
+    ax.set(xlabel="End-to-end Latency (ms)")
+    ax.set(ylabel="Histogram")
     outfile = "histogram.pdf"
-    pp = PdfPages(outfile)
-    pp.savefig(plot.get_figure().tight_layout())
-    pp.close()
-    #  run(["pdfcrop", outfile, outfile], stdout=DEVNULL, check=True)
+    fig.savefig(outfile, bbox_inches="tight", pad_inches=0.02)
     logger.info(f"Plot saved to {outfile}")
 
-    # Plot Boxplot
-    fig, ax = plt.subplots(figsize=FIGSIZE)
+
+def _fig_box(data):
+    """Plot a boxplot of every delay type."""
+    fig, ax = plt.subplots(figsize=FIGSIZE, constrained_layout=True)
     plot = sns.boxplot(data=data, orient="h", ax=ax)
 
     sns.despine(bottom=True, top=True)
     plot.set(ylabel="Delay Type")
     plot.set(xlabel="Time (us)")
     outfile = "boxplot.pdf"
-    pp = PdfPages(outfile)
-    pp.savefig(plot.get_figure().tight_layout())
-    pp.close()
-    #  run(["pdfcrop", outfile, outfile], stdout=DEVNULL, check=True)
+    fig.savefig(outfile, bbox_inches="tight", pad_inches=0.02)
     logger.info(f"Plot saved to {outfile}")
 
-    # Plot CDF
-    min_data = pd.read_csv("../data/min_results_1000.csv", skipinitialspace=True)
-    min_data["kind"] = "lower-bound"
-    min_data["e2e_ms"] = min_data["e2e (us)"] / 1000.0
 
-    fig, ax = plt.subplots(figsize=FIGSIZE)
-    data["e2e_ms"] = data["e2e_us"] / 1000.0
-    data["kind"] = "fvideo"
-    data = data.append(min_data[["e2e_ms", "kind"]])
+def _fig_cdf(e2e_ms, min_data):
+    """Plot the latency CDF against the lower-bound measurements."""
+    fig, ax = plt.subplots(figsize=FIGSIZE, constrained_layout=True)
+    data = pd.DataFrame(
+        {
+            "e2e_ms": e2e_ms,
+            "kind": pd.Categorical(["fvideo"] * len(e2e_ms), categories=KINDS),
+        }
+    )
+    combined = pd.concat([data, min_data[["e2e_ms", "kind"]]], ignore_index=True)
 
-    plot = sns.ecdfplot(data=data, x="e2e_ms", hue="kind", palette="colorblind")
+    plot = sns.ecdfplot(data=combined, x="e2e_ms", hue="kind", palette="colorblind")
 
     # Remove legend title
     plot.get_legend().set_title("")
@@ -82,13 +80,33 @@ def _plot(infile):
     plot.set(xlabel="End-to-end Latency (ms)")
     plot.set(ylabel="Proportion")
     outfile = "cdf.pdf"
-    pp = PdfPages(outfile)
-    pp.savefig(plot.get_figure().tight_layout())
-    pp.close()
-    run(["pdfcrop", outfile, outfile], stdout=DEVNULL, check=True)
+    fig.savefig(outfile, bbox_inches="tight", pad_inches=0.02)
     logger.info(f"Plot saved to {outfile}")
 
 
+def _plot(infile):
+    """Plotting logic."""
+    # Every column is a delay, so float32 is plenty for plotting
+    data = load(infile, dtype="float32")
+
+    # Convert to milliseconds once; float32 is plenty for ms-resolution plots
+    e2e_ms = np.multiply(data["e2e_us"].to_numpy(), 1e-3, dtype=np.float32)
+
+    min_data = load(
+        "../data/min_results_1000.csv",
+        usecols=["e2e (us)"],
+        dtype={"e2e (us)": "float32"},
+    )
+    min_data["kind"] = pd.Categorical(["lower-bound"] * len(min_data), categories=KINDS)
+    min_data["e2e_ms"] = np.multiply(
+        min_data["e2e (us)"].to_numpy(), 1e-3, dtype=np.float32
+    )
+
+    _fig_hist(e2e_ms)
+    _fig_box(data)
+    _fig_cdf(e2e_ms, min_data)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -2,16 +2,17 @@
 import argparse
 import logging
 import sys
-from subprocess import DEVNULL, run
+from types import MappingProxyType
 
 import matplotlib
-import matplotlib.pyplot as plt
-import pandas as pd
+
+matplotlib.use("Agg")
 import seaborn as sns
 import numpy as np
-from matplotlib.backends.backend_pdf import PdfPages
 from scipy.stats import ttest_ind
 
+from _common import load
+
 sns.set(style="whitegrid")
 sns.set_context("paper", font_scale=2.0, rc={"lines.linewidth": 2.25})
 
@@ -24,31 +25,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-FIGSIZE = (7, 6)
-
-def ttests(a, b, c):
-    res = ttest_ind(a, b)
-    logger.info(f"A vs. B: {res}")
-
-    res = ttest_ind(b, c)
-    logger.info(f"B vs. C: {res}")
-
-
-def _plot(infile):
-    """Plotting logic."""
-    fig, ax = plt.subplots(figsize=FIGSIZE)
-
-    # type,b,f1,precision,recall
-    data = pd.read_csv(infile, skipinitialspace=True)
-
-    # Filter users with too high of accuracy error
-    data = data[data.max_err < 10.0]
 
-    data["e2e_delay"] = data["delay_ms"] + 14
+def _freeze(estimates):
+    """Return a read-only view of nested (video, delay, quality) estimates."""
+    return MappingProxyType(
+        {
+            video: MappingProxyType(
+                {delay: MappingProxyType(qual) for delay, qual in delays.items()}
+            )
+            for video, delays in estimates.items()
+        }
+    )
 
-    baselines = {"barscene": 67396533, "square_timelapse": 33822082}
 
-    estimates = {
+# Frozen so callers cannot mutate the module-level estimates
+ESTIMATES = _freeze(
+    {
         "barscene": {
             0: {
                 9: 4.2,
@@ -132,20 +124,86 @@ def _plot(infile):
             },
         },
     }
+)
+
+VIDEOS = {"barscene": 0, "square_timelapse": 1}
+DELAYS = {0: 0, 31: 1, 67: 2}
+
+
+def _estimate_table(estimates):
+    """Pack estimates into a dense (video, delay, quality + 1) array."""
+    table = np.empty((len(VIDEOS), len(DELAYS), 11), dtype=np.float64)
+    for video, delays in estimates.items():
+        for delay, qualities in delays.items():
+            for quality, estimate in qualities.items():
+                table[VIDEOS[video], DELAYS[delay], quality + 1] = estimate
+    return table
+
+
+EST = _estimate_table(ESTIMATES)
 
-    bitrate = []
-    for row in data.itertuples():
-        bitrate.append((100 / estimates[row.video][row.delay_ms][row.quality]))
+# Bitrate for every (video, delay, quality) combination, computed once
+BITRATE = 100.0 / EST
+
+
+def _codes(values, mapping, name):
+    """Map values to table indices, raising KeyError for unknown values."""
+    codes = values.map(mapping)
+    missing = codes.isna()
+    if missing.any():
+        raise KeyError(f"Unknown {name}: {sorted(set(values[missing]))}")
+    return codes.to_numpy(dtype=np.intp)
+
+
+def compute_bitrate(data):
+    """Return each row's bitrate as a percentage of the baseline."""
+    vid = _codes(data["video"], VIDEOS, "video")
+    delay = _codes(data["delay_ms"], DELAYS, "delay_ms")
+    quality = data["quality"].to_numpy()
+    invalid = (quality < -1) | (quality > 9)
+    if invalid.any():
+        raise KeyError(f"Unknown quality: {sorted(set(quality[invalid].tolist()))}")
+    return BITRATE[vid, delay, quality + 1]
+
+
+def ttests(a, b, c):
+    res = ttest_ind(a, b)
+    logger.info(f"A vs. B: {res}")
+
+    res = ttest_ind(b, c)
+    logger.info(f"B vs. C: {res}")
+
+
+def _plot(infile):
+    """Plotting logic."""
+    # Narrow dtypes keep the frame seaborn walks small
+    data = load(
+        infile,
+        dtype={
+            "quality": "int8",
+            "delay_ms": "int16",
+            "video": "category",
+        },
+    )
+
+    # Filter users with too high of accuracy error
+    data = data[data.max_err < 10.0]
+
+    data["e2e_delay"] = data["delay_ms"] + 14
+
+    baselines = {"barscene": 67396533, "square_timelapse": 33822082}
 
-    data["bitrate"] = bitrate
+    data["bitrate"] = compute_bitrate(data)
 
     plot = sns.relplot(
         x="e2e_delay",
         y="bitrate",
         hue="video",
+        hue_order=list(VIDEOS),
         data=data,
         kind="line",
         style="video",
+        style_order=list(VIDEOS),
         markers=True,
         ci=95,
         palette="colorblind",
@@ -154,8 +212,9 @@ def _plot(infile):
     )
 
     # Draw minimum line
-    plt.plot([14, 14], [0, 100], color="gray", linewidth=2, linestyle="dotted")
-    plt.annotate(
+    ax = plot.ax
+    ax.plot([14, 14], [0, 100], color="gray", linewidth=2, linestyle="dotted")
+    ax.annotate(
         "min. latency",
         color="black",
         xy=(14, 83),
@@ -175,10 +234,7 @@ def _plot(infile):
     plot.set(ylabel="Bitrate (% of baseline)")
     plot.set(xlim=(0, 90), ylim=(0, 100))
     outfile = "user_study.pdf"
-    pp = PdfPages(outfile)
-    pp.savefig(plot._fig.tight_layout())
-    pp.close()
-    run(["pdfcrop", outfile, outfile], stdout=DEVNULL, check=True)
+    plot.fig.savefig(outfile, bbox_inches="tight", pad_inches=0.02)
     logger.info(f"Plot saved to {outfile}")
 
     ttests(data[data["e2e_delay"] == 14]["bitrate"], data[data["e2e_delay"] == 45]["bitrate"], data[data["e2e_delay"] == 81]["bitrate"])